@@ -2,12 +2,32 @@
 
 from __future__ import unicode_literals
 
+import collections
+import datetime
+import math
+import os
+import random
 import re
+import string
 import sys
+import threading
+import time
+
+# Internals of the re module: used only for optimizations, so their absence
+# must not break anything.
+try:
+    from re import _constants as _sre_constants, _parser as _sre_parse
+except ImportError:
+    try:
+        import sre_constants as _sre_constants
+        import sre_parse as _sre_parse
+    except ImportError:
+        _sre_constants = _sre_parse = None
 
 _PY2 = sys.version_info < (3,)
 if _PY2:
     str = unicode
+    chr = unichr
 
 
 class Error(Exception):
@@ -81,6 +101,24 @@ class InvalidListLength(ValidationError):
             self.object_name, len(self.object_value))
 
 
+class InvalidIterableLength(InvalidListLength):
+    """Invalid iterable length (according to schema)."""
+
+    length = None
+    """
+    Number of the iterable elements (max_length + 1 if the iterable is too long
+    - it's not consumed further).
+    """
+
+    def __init__(self, length, name=""):
+        super(InvalidIterableLength, self).__init__(None, name)
+        self.length = length
+
+    def get_message(self):
+        return "{0} has an invalid length: {1}.".format(
+            self.object_name, self.length)
+
+
 class UnknownParameterError(ValidationError):
     """Unknown object's key (according to schema)."""
 
@@ -117,8 +155,66 @@ class ParameterAlreadyExistsError(ValidationError):
         return "{0} already exists.".format(self.object_name)
 
 
+class LimitExceededError(ValidationError):
+    """Validation limits are exceeded."""
+
+    def __init__(self, limit, name=""):
+        super(LimitExceededError, self).__init__(
+            name, "Validation limits are exceeded.")
+        self.limit = limit
+
+    def get_message(self):
+        return "{0} exceeds validation limits: {1}.".format(
+            self.object_name, self.limit)
+
+
+class Limits(object):
+    """Validation limits.
+
+    Bound worst-case cost of validation of untrusted objects: validation is
+    aborted with LimitExceededError as soon as any of the limits is exceeded.
+    """
+
+    max_nodes = None
+    """Maximum number of validated objects (including list and dictionary elements)."""
+
+    max_depth = None
+    """Maximum nesting depth."""
+
+    max_keys = None
+    """Maximum number of keys in a dictionary."""
+
+    max_total_string_length = None
+    """Maximum total length of all validated strings."""
+
+    timeout = None
+    """Maximum validation time in seconds."""
+
+    def __init__(self, max_nodes=None, max_depth=None, max_keys=None,
+                 max_total_string_length=None, timeout=None):
+        if max_nodes is not None:
+            self.max_nodes = max_nodes
+
+        if max_depth is not None:
+            self.max_depth = max_depth
+
+        if max_keys is not None:
+            self.max_keys = max_keys
+
+        if max_total_string_length is not None:
+            self.max_total_string_length = max_total_string_length
+
+        if timeout is not None:
+            self.timeout = timeout
+
+
 class Object(object):
-    """Base class for all validators."""
+    """Base class for all validators.
+
+    Validators must not change their state after construction (except for
+    idempotent lazy initialization), so a single scheme instance may be safely
+    shared between threads including free-threaded Python builds.
+    """
 
     optional = False
     """True if the object value is optional."""
@@ -137,6 +233,41 @@ class Object(object):
 
         raise Error("Not implemented.")
 
+    def check(self, obj):
+        """Checks the specified object.
+
+        Returns True if the object is valid and False otherwise. Unlike
+        validate() it doesn't create any exceptions and doesn't modify the
+        object, so it's much cheaper for filtering out invalid objects.
+
+        The default implementation falls back to validate(), so custom
+        validators should override it if they care about performance.
+        """
+
+        try:
+            self.validate(obj)
+        except ValidationError:
+            return False
+
+        return True
+
+    def _generate(self, rng):
+        """Generates a random valid object.
+
+        Used by generate(). Custom validators should override it along with
+        _generate_invalid() to support object generation.
+        """
+
+        raise Error("{0} validator doesn't support object generation.", type(self).__name__)
+
+    def _generate_invalid(self, rng):
+        """Generates a random invalid object.
+
+        Returns (object, object name of the error validate() raises for it).
+        """
+
+        raise Error("{0} validator doesn't support object generation.", type(self).__name__)
+
 
 class _BasicType(Object):
     """Base class for basic type validators."""
@@ -161,6 +292,31 @@ class _BasicType(Object):
 
         return obj
 
+    def check(self, obj):
+        """Checks the specified object."""
+
+        return type(obj) in self._types and (
+            self.__choices is None or obj in self.__choices)
+
+    def _generate(self, rng):
+        if self.__choices is not None:
+            choices = self.__choices
+            if not isinstance(choices, (list, tuple)):
+                # Sets must be ordered to make the objects reproducible
+                choices = sorted(choices, key=repr)
+
+            return rng.choice(choices)
+
+        return self._generate_value(rng)
+
+    def _generate_invalid(self, rng):
+        return None, ""
+
+    def _generate_value(self, rng):
+        """Generates a random value of the type (choices aside)."""
+
+        raise Error("Not implemented.")
+
 
 class _BasicNumber(_BasicType):
     """Base class for number type validators."""
@@ -193,11 +349,30 @@ class _BasicNumber(_BasicType):
 
         return obj
 
+    def check(self, obj):
+        """Checks the specified object."""
+
+        return super(_BasicNumber, self).check(obj) and not (
+            self.__min is not None and obj < self.__min or
+            self.__max is not None and obj > self.__max
+        )
+
+    def _generate_value(self, rng):
+        low, high = _random_range(self.__min, self.__max)
+
+        if float in self._types:
+            return min(max(rng.uniform(low, high), low), high)
+
+        return rng.randint(int(math.ceil(low)), int(math.floor(high)))
+
 
 class Bool(_BasicType):
     """Boolean type validator."""
     _types = (bool,)
 
+    def _generate_value(self, rng):
+        return rng.random() < 0.5
+
 
 class Float(_BasicNumber):
     """Float type validator."""
@@ -224,17 +399,21 @@ class String(_BasicType):
     __regex = None
     """Regular expression the string must match to."""
 
-    def __init__(self, min_length=None, max_length=None, regex=None, **kwargs):
+    def __init__(self, min_length=None, max_length=None, regex=None, regex_mode="search",
+                 **kwargs):
         if min_length is not None:
             self.__min_length = min_length
 
         if max_length is not None:
             self.__max_length = max_length
 
+        if regex_mode not in _REGEX_MODES:
+            raise Error("Invalid regular expression mode: {0}.", regex_mode)
+
         if regex is not None:
             if isinstance(regex, (str, bytes)):
-                regex = re.compile(regex)
-            self.__regex = regex
+                regex = _compile_regex(regex)
+            self.__regex = _Regex(regex, regex_mode)
 
         super(String, self).__init__(**kwargs)
 
@@ -242,16 +421,376 @@ class String(_BasicType):
         """Validates the specified object."""
 
         obj = super(String, self).validate(obj)
+        _check_limits(obj)
 
         if (
             self.__min_length is not None and len(obj) < self.__min_length or
             self.__max_length is not None and len(obj) > self.__max_length or
-            self.__regex is not None and self.__regex.search(obj) is None
+            self.__regex is not None and not self.__regex.matches(obj)
         ):
             raise InvalidValueError(obj)
 
         return obj
 
+    def check(self, obj):
+        """Checks the specified object."""
+
+        return super(String, self).check(obj) and not (
+            self.__min_length is not None and len(obj) < self.__min_length or
+            self.__max_length is not None and len(obj) > self.__max_length or
+            self.__regex is not None and not self.__regex.matches(obj)
+        )
+
+    def _generate_value(self, rng):
+        if self.__regex is not None:
+            raise Error("Unable to generate strings for a regular expression.")
+
+        min_length = self.__min_length or 0
+        max_length = min_length + 16 if self.__max_length is None else self.__max_length
+
+        return _random_string(rng, rng.randint(min_length, max_length))
+
+
+_REGEX_MODES = ("search", "match", "fullmatch")
+"""Supported regular expression modes (names of the regular expression object methods)."""
+
+_RE_PATTERN_TYPE = type(re.compile(""))
+
+
+def _compile_regex(pattern):
+    """Compiles the regular expression.
+
+    Some errors (for example, variable-width look-behind) are detected only
+    by compilation, so invalid patterns can't be rejected by parsing alone.
+    """
+
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise Error("Invalid regular expression {0}: {1}.", _repr(pattern), e)
+
+
+class _Regex(object):
+    """Regular expression matcher.
+
+    The regular expression may be a compiled regular expression object of any
+    engine which has search(), match() and fullmatch() methods (for example,
+    a linear-time re2 for untrusted patterns).
+
+    For regular expressions of the standard re module, strings are
+    pre-checked against length bounds and literal prefix and suffix of the
+    pattern to reject them without running the regular expression engine.
+    The pre-checks are prepared on first usage: schemes are usually created at
+    import time by processes which may not even use them.
+    """
+
+    def __init__(self, regex, mode):
+        self.__regex = regex
+        self.__mode = mode
+
+    def matches(self, string):
+        """Returns True if the string matches the regular expression."""
+
+        # Replace the method by the compiled matcher, so all subsequent calls
+        # go directly to it.
+        self.matches = self.__compile()
+        return self.matches(string)
+
+    def __getstate__(self):
+        # The compiled matcher is a closure which can't be pickled
+        state = self.__dict__.copy()
+        state.pop("matches", None)
+        return state
+
+    def __compile(self):
+        regex, mode = self.__regex, self.__mode
+
+        if mode == "fullmatch" and not hasattr(regex, "fullmatch"):
+            # Python < 3.4
+            match = re.compile(r"(?:{0})\Z".format(regex.pattern), regex.flags).match
+        else:
+            match = getattr(regex, mode)
+
+        min_length, max_length, prefix, suffix = 0, None, "", ""
+        if type(regex) is _RE_PATTERN_TYPE and isinstance(regex.pattern, str):
+            try:
+                min_length, max_length, prefix, suffix = _analyze_regex(regex, mode)
+            except Exception:
+                # The analysis relies on internals of the re module which may
+                # change, so just don't use the pre-checks if it fails.
+                pass
+
+        if not min_length and max_length is None and not prefix and not suffix:
+            return lambda string: match(string) is not None
+
+        def matches(string):
+            return not (
+                len(string) < min_length or
+                max_length is not None and len(string) > max_length or
+                prefix and not string.startswith(prefix) or
+                suffix and not string.endswith(suffix)
+            ) and match(string) is not None
+
+        return matches
+
+
+def _analyze_regex(regex, mode):
+    """Analyzes the compiled regular expression.
+
+    Returns (min length, max length or None, prefix, suffix) of strings which
+    may match the regular expression in the specified mode.
+    """
+
+    parsed = _sre_parse.parse(regex.pattern, regex.flags)
+
+    min_width, max_width = parsed.getwidth()
+    min_length, max_length, prefix, suffix = min_width, None, "", ""
+
+    # Older Python versions don't take backreferences into account when
+    # calculating maximum width.
+    state = getattr(parsed, "state", None) or getattr(parsed, "pattern", None)
+
+    if mode == "fullmatch" and max_width < _sre_constants.MAXREPEAT and hasattr(
+            state, "groupwidths"):
+        max_length = max_width
+
+    if regex.flags & re.IGNORECASE:
+        return min_length, max_length, prefix, suffix
+
+    items = list(parsed)
+
+    anchors = [_sre_constants.AT_BEGINNING_STRING]
+    if not regex.flags & re.MULTILINE:
+        anchors.append(_sre_constants.AT_BEGINNING)
+
+    start = 0
+    while start < len(items) and items[start][0] is _sre_constants.AT and \
+            items[start][1] in anchors:
+        start += 1
+
+    # In search mode the prefix is known only for anchored patterns
+    if mode != "search" or start:
+        end = start
+        while end < len(items) and items[end][0] is _sre_constants.LITERAL:
+            end += 1
+
+        prefix = "".join(chr(code) for _, code in items[start:end])
+
+    if mode == "fullmatch":
+        anchors = (_sre_constants.AT_END, _sre_constants.AT_END_STRING)
+
+        end = len(items)
+        while end > 0 and items[end - 1][0] is _sre_constants.AT and \
+                items[end - 1][1] in anchors:
+            end -= 1
+
+        start = end
+        while start > 0 and items[start - 1][0] is _sre_constants.LITERAL:
+            start -= 1
+
+        suffix = "".join(chr(code) for _, code in items[start:end])
+
+    return min_length, max_length, prefix, suffix
+
+
+class _Converter(Object):
+    """Base class for validators which convert strings to other objects.
+
+    Strings are parsed and validated in one step, so there is no need to check
+    them against a regular expression before the conversion.
+    """
+
+    def validate(self, obj):
+        """Validates the specified object."""
+
+        if type(obj) is not str:
+            raise InvalidTypeError(obj)
+
+        _check_limits(obj)
+
+        value = self._convert(obj)
+        if value is None:
+            raise InvalidValueError(obj)
+
+        return value
+
+    def check(self, obj):
+        """Checks the specified object."""
+
+        return type(obj) is str and self._convert(obj) is not None
+
+    def _convert(self, obj):
+        """Converts the string or returns None if it's invalid."""
+
+        raise Error("Not implemented.")
+
+    def _generate_invalid(self, rng):
+        return None, ""
+
+
+class _RangeConverter(_Converter):
+    """Base class for converters with min/max validators."""
+
+    __min = None
+    """Minimum value."""
+
+    __max = None
+    """Maximum value."""
+
+    def __init__(self, min=None, max=None, **kwargs):
+        if min is not None:
+            self.__min = min
+
+        if max is not None:
+            self.__max = max
+
+        super(_RangeConverter, self).__init__(**kwargs)
+
+    def _convert(self, obj):
+        value = self._parse(obj)
+
+        try:
+            if (
+                value is None or
+                self.__min is not None and value < self.__min or
+                self.__max is not None and value > self.__max
+            ):
+                return None
+        except TypeError:
+            # For example, comparison of naive and aware datetimes
+            return None
+
+        return value
+
+    def _parse(self, obj):
+        """Parses the string or returns None if it's invalid."""
+
+        raise Error("Not implemented.")
+
+    def _generate(self, rng):
+        return self._generate_value(rng, self.__min, self.__max)
+
+    def _generate_value(self, rng, low, high):
+        """Generates a random string for a value from the specified range."""
+
+        raise Error("Not implemented.")
+
+
+class DateTime(_RangeConverter):
+    """ISO 8601 date and time string to datetime converter."""
+
+    def _parse(self, obj):
+        try:
+            return _parse_datetime(obj)
+        except ValueError:
+            return None
+
+    def _generate_value(self, rng, low, high):
+        if low is None and high is None:
+            low = datetime.datetime(2000, 1, 1)
+
+        if low is None:
+            low = high - datetime.timedelta(days=10000)
+        elif high is None:
+            high = low + datetime.timedelta(days=10000)
+
+        value = low + datetime.timedelta(seconds=rng.uniform(0, (high - low).total_seconds()))
+        return min(value, high).isoformat()
+
+
+class Decimal(_RangeConverter):
+    """Decimal number string to Decimal converter.
+
+    Accepts only plain ASCII numbers without whitespace or underscores.
+    """
+
+    def _parse(self, obj):
+        decimal = _import("decimal")
+
+        if not _DECIMAL_CHARACTERS.issuperset(obj):
+            return None
+
+        try:
+            value = decimal.Decimal(obj)
+        except (ValueError, decimal.InvalidOperation):
+            return None
+
+        return value if value.is_finite() else None
+
+    def _generate_value(self, rng, low, high):
+        decimal = _import("decimal")
+
+        low, high = _random_range(low, high)
+        value = decimal.Decimal(str(round(rng.uniform(float(low), float(high)), 2)))
+        return str(min(max(value, low), high))
+
+
+_DECIMAL_CHARACTERS = frozenset("0123456789+-.eE")
+"""Characters allowed in decimal number strings."""
+
+
+class UUID(_Converter):
+    """UUID string to UUID converter.
+
+    Accepts only the canonical xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx form.
+    """
+
+    def _convert(self, obj):
+        if (
+            len(obj) != 36 or
+            [len(part) for part in obj.split("-")] != [8, 4, 4, 4, 12] or
+            not _HEX_DIGITS.issuperset(obj.replace("-", ""))
+        ):
+            return None
+
+        return _import("uuid").UUID(obj)
+
+    def _generate(self, rng):
+        return str(_import("uuid").UUID(int=rng.getrandbits(128)))
+
+
+_HEX_DIGITS = frozenset(string.hexdigits)
+"""Hexadecimal digits."""
+
+
+class IPAddress(_Converter):
+    """IP address string to IPv4Address/IPv6Address converter."""
+
+    __version = None
+    """IP version (4 or 6)."""
+
+    def __init__(self, version=None, **kwargs):
+        try:
+            _import("ipaddress")
+        except ImportError:
+            raise Error("IPAddress validator requires ipaddress module.")
+
+        if version is not None:
+            self.__version = version
+
+        super(IPAddress, self).__init__(**kwargs)
+
+    def _convert(self, obj):
+        try:
+            value = _import("ipaddress").ip_address(obj)
+        except ValueError:
+            return None
+
+        if self.__version is not None and value.version != self.__version:
+            return None
+
+        return value
+
+    def _generate(self, rng):
+        ipaddress = _import("ipaddress")
+
+        version = self.__version or rng.choice((4, 6))
+
+        if version == 4:
+            return str(ipaddress.IPv4Address(rng.getrandbits(32)))
+
+        return str(ipaddress.IPv6Address(rng.getrandbits(128)))
+
 
 class List(Object):
     """List validator."""
@@ -283,13 +822,17 @@ class List(Object):
         if type(obj) is not list:
             raise InvalidTypeError(obj)
 
+        _check_limits(obj)
+
         if (
             self.__min_length is not None and len(obj) < self.__min_length or
             self.__max_length is not None and len(obj) > self.__max_length
         ):
             raise InvalidListLength(obj)
 
-        if self.__scheme is not None:
+        if type(self.__scheme) is DictScheme:
+            _validate_rows(obj, self.__scheme)
+        elif self.__scheme is not None:
             for index, value in enumerate(obj):
                 try:
                     obj[index] = validate_object(value, self.__scheme)
@@ -299,65 +842,276 @@ class List(Object):
 
         return obj
 
+    def check(self, obj):
+        """Checks the specified object."""
 
-class Dict(Object):
-    """Dictionary validator."""
-
-    __key_scheme = None
-    """Key scheme."""
+        if type(obj) is not list:
+            return False
 
-    __value_scheme = None
-    """Value scheme."""
+        if (
+            self.__min_length is not None and len(obj) < self.__min_length or
+            self.__max_length is not None and len(obj) > self.__max_length
+        ):
+            return False
 
-    def __init__(self, key_scheme=None, value_scheme=None, **kwargs):
-        super(Dict, self).__init__(**kwargs)
+        if self.__scheme is not None:
+            for value in obj:
+                if not check_object(value, self.__scheme):
+                    return False
 
-        if key_scheme is not None:
-            self.__key_scheme = key_scheme
+        return True
 
-        if value_scheme is not None:
-            self.__value_scheme = value_scheme
+    def _generate(self, rng):
+        return _generate_list(rng, self.__scheme, self.__min_length, self.__max_length)
 
-    def validate(self, obj):
-        """Validates the specified object."""
+    def _generate_invalid(self, rng):
+        obj = self._generate(rng)
+        if not obj or self.__scheme is None:
+            return None, ""
 
-        if type(obj) is not dict:
-            raise InvalidTypeError(obj)
+        index = rng.randrange(len(obj))
+        obj[index], name = self.__scheme._generate_invalid(rng)
 
-        for key, value in tuple(obj.items()):
-            try:
-                valid_key = key if self.__key_scheme is None \
-                    else validate_object(key, self.__key_scheme)
+        return obj, "[{0}]".format(index) + name
 
-                valid_value = value if self.__value_scheme is None \
-                    else validate_object(value, self.__value_scheme)
-            except ValidationError as e:
-                e.prefix_object_name(_dict_key_name(key))
-                raise
 
-            if valid_key is not key:
-                del obj[key]
+class Iterable(Object):
+    """Lazy validator for iterables (iterators, generators, etc.).
 
-                if valid_key in obj:
-                    raise ParameterAlreadyExistsError(_dict_key_name(valid_key))
+    Returns a generator which validates the elements as they are consumed, so
+    the iterable isn't materialized. Only the type is validated eagerly, so
+    errors raised during the consumption have only the element index as object
+    name, and validate() options (limits, memoization) don't apply to them.
+    """
 
-                obj[valid_key] = valid_value
-            elif valid_value is not value:
-                obj[valid_key] = valid_value
+    __scheme = None
+    """Value scheme."""
 
-        return obj
+    __min_length = None
+    """Minimum length."""
 
+    __max_length = None
+    """Maximum length."""
 
-class DictScheme(Object):
-    """Validator for a dictionary against a dictionary key scheme."""
+    def __init__(self, scheme=None, min_length=None, max_length=None, **kwargs):
+        super(Iterable, self).__init__(**kwargs)
 
-    __ignore_unknown = False
-    """Ignore unknown keys."""
+        if scheme is not None:
+            self.__scheme = scheme
+
+        if min_length is not None:
+            self.__min_length = min_length
+
+        if max_length is not None:
+            self.__max_length = max_length
+
+    def validate(self, obj):
+        """Validates the specified object."""
+
+        if type(obj) in (str, bytes, dict):
+            raise InvalidTypeError(obj)
+
+        try:
+            iterator = iter(obj)
+        except TypeError:
+            raise InvalidTypeError(obj)
+
+        return self.__iterate(iterator)
+
+    def check(self, obj):
+        """Checks the specified object.
+
+        The iterable isn't consumed, so only its type is checked.
+        """
+
+        if type(obj) in (str, bytes, dict):
+            return False
+
+        try:
+            iter(obj)
+        except TypeError:
+            return False
+
+        return True
+
+    def __iterate(self, iterator):
+        """Validates the elements as they are consumed."""
+
+        length = 0
+
+        for value in iterator:
+            if self.__max_length is not None and length >= self.__max_length:
+                raise InvalidIterableLength(length + 1)
+
+            if self.__scheme is not None:
+                try:
+                    value = validate_object(value, self.__scheme)
+                except ValidationError as e:
+                    e.prefix_object_name("[{0}]".format(length))
+                    raise
+
+            length += 1
+            yield value
+
+        if self.__min_length is not None and length < self.__min_length:
+            raise InvalidIterableLength(length)
+
+    def _generate(self, rng):
+        return _generate_list(rng, self.__scheme, self.__min_length, self.__max_length)
+
+    def _generate_invalid(self, rng):
+        return None, ""
+
+
+class Dict(Object):
+    """Dictionary validator."""
+
+    __key_scheme = None
+    """Key scheme."""
+
+    __value_scheme = None
+    """Value scheme."""
+
+    def __init__(self, key_scheme=None, value_scheme=None, **kwargs):
+        super(Dict, self).__init__(**kwargs)
+
+        if key_scheme is not None:
+            self.__key_scheme = key_scheme
+
+        if value_scheme is not None:
+            self.__value_scheme = value_scheme
+
+    def validate(self, obj):
+        """Validates the specified object."""
+
+        if type(obj) is not dict:
+            raise InvalidTypeError(obj)
+
+        _check_limits(obj)
+
+        if self.__key_scheme is None and self.__value_scheme is None:
+            return obj
+
+        # The dictionary is iterated without copying: values of the existing
+        # keys may be replaced in place, but converted keys are collected and
+        # applied after the iteration.
+        converted_keys = None
+
+        for key, value in obj.items():
+            try:
+                valid_key = key if self.__key_scheme is None \
+                    else validate_object(key, self.__key_scheme)
+
+                valid_value = value if self.__value_scheme is None \
+                    else validate_object(value, self.__value_scheme)
+            except ValidationError as e:
+                e.prefix_object_name(_dict_key_name(key))
+                raise
+
+            if valid_key is not key:
+                if converted_keys is None:
+                    converted_keys = []
+                converted_keys.append((key, valid_key, valid_value))
+            elif valid_value is not value:
+                obj[key] = valid_value
+
+        if converted_keys is not None:
+            for key, valid_key, valid_value in converted_keys:
+                del obj[key]
+
+                if valid_key in obj:
+                    raise ParameterAlreadyExistsError(_dict_key_name(valid_key))
+
+                obj[valid_key] = valid_value
+
+        return obj
+
+    def check(self, obj):
+        """Checks the specified object."""
+
+        if type(obj) is not dict:
+            return False
+
+        # Custom key validators may convert the keys, so they are converted
+        # here to detect key collisions the same way validate() does it.
+        convert_keys = self.__key_scheme is not None and \
+            not isinstance(self.__key_scheme, _BasicType)
+        converted_keys = None
+
+        for key, value in obj.items():
+            if self.__key_scheme is not None:
+                if convert_keys:
+                    if isinstance(self.__key_scheme, _Converter):
+                        valid_key = self.__key_scheme._convert(key) if type(key) is str else None
+                        if valid_key is None:
+                            return False
+                    else:
+                        try:
+                            valid_key = validate_object(key, self.__key_scheme)
+                        except ValidationError:
+                            return False
+
+                    if valid_key is not key:
+                        if converted_keys is None:
+                            converted_keys = []
+                        converted_keys.append((key, valid_key))
+                elif not check_object(key, self.__key_scheme):
+                    return False
+
+            if self.__value_scheme is not None and not check_object(value, self.__value_scheme):
+                return False
+
+        if converted_keys is not None:
+            keys = set(obj)
+
+            for key, valid_key in converted_keys:
+                keys.discard(key)
+
+                if valid_key in keys:
+                    return False
+
+                keys.add(valid_key)
+
+        return True
+
+    def _generate(self, rng):
+        key_scheme, value_scheme = self.__key_scheme, self.__value_scheme
+
+        return dict((
+            _random_string(rng, 8) if key_scheme is None else key_scheme._generate(rng),
+            rng.randint(-1000, 1000) if value_scheme is None else value_scheme._generate(rng),
+        ) for _ in range(rng.randint(0, 5)))
+
+    def _generate_invalid(self, rng):
+        obj = self._generate(rng)
+        if not obj or self.__value_scheme is None:
+            return None, ""
+
+        key = rng.choice(list(obj))
+        obj[key], name = self.__value_scheme._generate_invalid(rng)
+
+        return obj, _dict_key_name(key) + name
+
+
+class DictScheme(Object):
+    """Validator for a dictionary against a dictionary key scheme."""
+
+    __ignore_unknown = False
+    """Ignore unknown keys."""
 
     __delete_unknown = False
     """Delete unknown keys."""
 
-    def __init__(self, scheme, ignore_unknown=False, delete_unknown=False, **kwargs):
+    __record_fields = None
+    """Fields of the records."""
+
+    record_type = None
+    """
+    A namedtuple type of records returned instead of validated dictionaries
+    (if the validator is created with record=True).
+    """
+
+    def __init__(self, scheme, ignore_unknown=False, delete_unknown=False, record=False, **kwargs):
         super(DictScheme, self).__init__(**kwargs)
 
         self.__scheme = scheme
@@ -368,19 +1122,32 @@ class DictScheme(Object):
         if delete_unknown:
             self.__delete_unknown = True
 
+        if record:
+            self.__record_fields = tuple(scheme)
+
+            try:
+                self.record_type = _get_record_type(self.__record_fields)
+            except (ValueError, TypeError) as e:
+                raise Error("Unable to create a record type for the scheme: {0}", e)
+
+    def __getstate__(self):
+        # The record type can't be pickled by reference, so it's recreated on
+        # unpickling.
+        state = self.__dict__.copy()
+        state.pop("record_type", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+        if self.__record_fields is not None:
+            self.record_type = _get_record_type(self.__record_fields)
+
     def validate(self, obj):
         """Validates the specified object."""
 
-        if type(obj) is not dict:
-            raise InvalidTypeError(obj)
-
-        if self.__delete_unknown:
-            for key in set(obj) - set(self.__scheme):
-                del obj[key]
-        elif not self.__ignore_unknown:
-            unknown = set(obj) - set(self.__scheme)
-            if unknown:
-                raise UnknownParameterError(_dict_key_name(unknown.pop()))
+        for key in self.__validate_keys(obj):
+            del obj[key]
 
         for key, scheme in self.__scheme.items():
             if key in obj:
@@ -393,17 +1160,340 @@ class DictScheme(Object):
                 if _get_optional(scheme) is None:
                     raise MissingParameterError(_dict_key_name(key))
 
+        if self.record_type is not None:
+            return self.__make_record(obj)
+
+        return obj
+
+    def _validate_rows(self, rows):
+        """Validates a list of dictionaries (records) in place.
+
+        Instead of validating the records one by one, checks key set of each
+        distinct record shape only once and then validates each field across
+        all records of the shape in a single loop. Reports the same error as
+        validation of the records one by one would: for the first invalid
+        record and its first invalid field. The records following the invalid
+        one are left unmodified, but note that objects nested into them may be
+        already validated in place by the time the error is found.
+        """
+
+        shapes = {}
+        last_keys = last_indexes = None
+
+        # Index of the first invalid record found so far - only the preceding
+        # records have to be validated further.
+        limit = len(rows)
+        invalid_keys = False
+        error = None
+
+        for index, row in enumerate(rows):
+            if type(row) is dict and last_keys is not None and row.keys() == last_keys:
+                last_indexes.append(index)
+                continue
+
+            try:
+                unknown = self.__validate_keys(row)
+
+                for key, scheme in self.__scheme.items():
+                    if key not in row and _get_optional(scheme) is None:
+                        raise MissingParameterError(_dict_key_name(key))
+            except LimitExceededError as e:
+                e.prefix_object_name("[{0}]".format(index))
+                raise
+            except ValidationError:
+                limit, invalid_keys = index, True
+                break
+
+            last_keys = frozenset(row)
+            last_indexes = shapes.setdefault(last_keys, ([], unknown))[0]
+            last_indexes.append(index)
+
+        # Original values of the converted fields to restore them in the
+        # records following the invalid one.
+        converted = []
+
+        for keys, (indexes, unknown) in shapes.items():
+            for key, scheme in self.__scheme.items():
+                if key not in keys:
+                    continue
+
+                for index in indexes:
+                    if index >= limit:
+                        break
+
+                    row = rows[index]
+                    value = row[key]
+
+                    try:
+                        valid_value = validate_object(value, scheme)
+                    except ValidationError as e:
+                        e.prefix_object_name(_dict_key_name(key))
+                        e.prefix_object_name("[{0}]".format(index))
+
+                        if isinstance(e, LimitExceededError):
+                            raise
+
+                        limit, invalid_keys, error = index, False, e
+                        break
+
+                    if valid_value is not value:
+                        row[key] = valid_value
+                        converted.append((index, key, value))
+
+        if limit < len(rows):
+            for index, key, value in converted:
+                if index > limit:
+                    rows[index][key] = value
+
+        # Unknown keys are deleted only now to not modify the records
+        # following the invalid one. The record with invalid keys is handled
+        # by its validation below.
+        validated = limit if invalid_keys else limit + 1
+
+        for keys, (indexes, unknown) in shapes.items():
+            if unknown:
+                for index in indexes:
+                    if index >= validated:
+                        break
+
+                    row = rows[index]
+                    for key in unknown:
+                        del row[key]
+
+        if invalid_keys:
+            # Get the exact error the record validation reports: it may be an
+            # error for a field which precedes the missing one.
+            try:
+                self.validate(rows[limit])
+            except ValidationError as e:
+                e.prefix_object_name("[{0}]".format(limit))
+                raise
+
+        if error is not None:
+            raise error
+
+        if self.record_type is not None:
+            for index, row in enumerate(rows):
+                rows[index] = self.__make_record(row)
+
+    def __make_record(self, obj):
+        """Creates a record from the validated dictionary.
+
+        Missing optional keys are set to None, unknown keys are dropped.
+        """
+
+        return self.record_type._make(map(obj.get, self.__record_fields))
+
+    def __validate_keys(self, obj):
+        """Validates type and unknown keys of the specified object.
+
+        Returns unknown keys which have to be deleted from the object.
+        """
+
+        if type(obj) is not dict:
+            raise InvalidTypeError(obj)
+
+        _check_limits(obj)
+
+        if self.__delete_unknown:
+            return set(obj) - set(self.__scheme)
+
+        if not self.__ignore_unknown:
+            unknown = set(obj) - set(self.__scheme)
+            if unknown:
+                raise UnknownParameterError(_dict_key_name(unknown.pop()))
+
+        return ()
+
+    def check(self, obj):
+        """Checks the specified object."""
+
+        if type(obj) is not dict:
+            return False
+
+        if not self.__delete_unknown and not self.__ignore_unknown:
+            for key in obj:
+                if key not in self.__scheme:
+                    return False
+
+        for key, scheme in self.__scheme.items():
+            if key in obj:
+                if not check_object(obj[key], scheme):
+                    return False
+            elif _get_optional(scheme) is None:
+                return False
+
+        return True
+
+    def _generate(self, rng):
+        obj = {}
+
+        for key, scheme in self.__scheme.items():
+            if _get_optional(scheme) is None or rng.random() < 0.5:
+                obj[key] = scheme._generate(rng)
+
         return obj
 
+    def _generate_invalid(self, rng):
+        obj = self._generate(rng)
+        if not obj:
+            return None, ""
+
+        key = rng.choice(list(obj))
+        obj[key], name = self.__scheme[key]._generate_invalid(rng)
+
+        return obj, _dict_key_name(key) + name
+
+
+_RECORD_TYPES = {}
+"""Record types by their fields."""
 
-def validate(name, obj, scheme):
-    """Validates the specified object."""
+
+def _get_record_type(fields):
+    """Returns a namedtuple record type with the specified fields.
+
+    Record types are generated, so they can't be pickled by reference as
+    usual classes. Instead, records are pickled with their fields and
+    unpickled to the record type with the same fields.
+    """
+
+    record_type = _RECORD_TYPES.get(fields)
+
+    if record_type is None:
+        record_type = collections.namedtuple("Record", fields)
+        record_type.__reduce__ = _reduce_record
+        record_type = _RECORD_TYPES.setdefault(fields, record_type)
+
+    return record_type
+
+
+def _reduce_record(record):
+    return _make_record, (record._fields, tuple(record))
+
+
+def _make_record(fields, values):
+    return _get_record_type(fields)._make(values)
+
+
+def validate(name, obj, scheme, limits=None, memoize=False):
+    """Validates the specified object.
+
+    If limits are specified, validation is aborted with LimitExceededError as
+    soon as any of them is exceeded.
+
+    If memoize is True, lists and dictionaries referenced from several places
+    of the object are validated only once per scheme and the result is reused.
+    It's useful for objects which aren't decoded from JSON and may share
+    subobjects.
+    """
+
+    if limits is None and not memoize:
+        try:
+            return validate_object(obj, scheme)
+        except ValidationError as e:
+            e.prefix_object_name(name)
+            raise
+
+    parent_context = _local.context
+    _local.context = _ValidationContext(limits or Limits(), memoize)
+    _set_context_count(1)
 
     try:
         return validate_object(obj, scheme)
     except ValidationError as e:
         e.prefix_object_name(name)
         raise
+    finally:
+        _set_context_count(-1)
+        _local.context = parent_context
+
+
+def validate_threaded(objs, scheme, workers=None):
+    """Validates the specified objects in a thread pool.
+
+    Returns a list of validated objects. If any of the objects is invalid,
+    raises an error for the first of them with its index as object name (like
+    List validator does). Gives a real speedup only on free-threaded Python
+    builds.
+    """
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    if workers is None:
+        workers = _cpu_count()
+    elif workers < 1:
+        raise Error("Invalid number of workers: {0}.", workers)
+
+    objs = list(objs)
+
+    chunk_size = max(1, -(-len(objs) // (workers * 4)))
+    chunks = [(index, objs[index:index + chunk_size])
+              for index in range(0, len(objs), chunk_size)]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for index, chunk in executor.map(lambda chunk: _validate_chunk(chunk, scheme), chunks):
+            objs[index:index + len(chunk)] = chunk
+
+    return objs
+
+
+def _cpu_count():
+    """Returns the number of CPUs."""
+
+    try:
+        return os.cpu_count() or 1
+    except AttributeError:
+        # Python 2
+        import multiprocessing
+        return multiprocessing.cpu_count()
+
+
+def _validate_chunk(chunk, scheme):
+    """Validates a chunk of objects for validate_threaded()."""
+
+    start, objs = chunk
+
+    for index, obj in enumerate(objs):
+        try:
+            objs[index] = validate_object(obj, scheme)
+        except ValidationError as e:
+            e.prefix_object_name("[{0}]".format(start + index))
+            raise
+
+    return chunk
+
+
+def is_valid(obj, scheme):
+    """Checks the specified object.
+
+    Returns True if the object is valid and False otherwise. Never raises
+    ValidationError and doesn't modify the object.
+    """
+
+    return check_object(obj, scheme)
+
+
+def generate(scheme, count=None, seed=None, invalid_ratio=0):
+    """Generates random objects matching the specified scheme.
+
+    Returns a generator of (object, error object name) tuples: count of them or
+    an infinite stream if count is None. The specified fraction of objects is
+    invalid - for them the error object name is object_name of ValidationError
+    validate_object() raises for the object. For valid objects it's None.
+
+    The objects are reproducible for the same seed.
+    """
+
+    rng = random.Random(seed)
+    generated = 0
+
+    while count is None or generated < count:
+        if invalid_ratio and rng.random() < invalid_ratio:
+            yield scheme._generate_invalid(rng)
+        else:
+            yield scheme._generate(rng), None
+
+        generated += 1
 
 
 def validate_object(obj, scheme):
@@ -414,7 +1504,173 @@ def validate_object(obj, scheme):
     the future.
     """
 
-    return scheme.validate(obj)
+    context = _local.context if _context_count else None
+    if context is None:
+        return scheme.validate(obj)
+
+    return context.validate(obj, scheme)
+
+
+def _validate_rows(rows, scheme):
+    """Validates the specified list of dictionaries against DictScheme.
+
+    Note: this function is for internal usage only (from validators).
+    """
+
+    context = _local.context if _context_count else None
+    if context is None:
+        return scheme._validate_rows(rows)
+
+    return context.validate_rows(rows, scheme)
+
+
+def check_object(obj, scheme):
+    """Checks the specified object.
+
+    Note: this function is for internal usage only (from validators). It's
+    needed for the same reasons as validate_object().
+    """
+
+    return scheme.check(obj)
+
+
+class _Local(threading.local):
+    """Thread-local state."""
+
+    context = None
+    """Context of the current validate() call."""
+
+
+_local = _Local()
+
+_context_count = 0
+"""Number of active validation contexts in all threads.
+
+Allows to not look up the thread-local context on each validated object when
+there are no active contexts at all.
+"""
+
+_context_count_lock = threading.Lock()
+
+
+def _set_context_count(delta):
+    """Changes the number of active validation contexts."""
+
+    global _context_count
+
+    with _context_count_lock:
+        _context_count += delta
+
+
+_monotonic = getattr(time, "monotonic", time.time)
+
+
+class _ValidationContext(object):
+    """State of a single validate() call."""
+
+    def __init__(self, limits, memoize=False):
+        self.limits = limits
+        self.nodes = 0
+        self.depth = 0
+        self.string_length = 0
+        self.deadline = None if limits.timeout is None else _monotonic() + limits.timeout
+
+        # Maps (id(obj), id(scheme)) to (obj, validated object). The original
+        # object is stored to guarantee that its id won't be reused.
+        self.memo = {} if memoize else None
+
+    def validate(self, obj, scheme):
+        """Validates the specified object."""
+
+        memo_key = None
+        if self.memo is not None and type(obj) in (list, dict):
+            memo_key = (id(obj), id(scheme))
+            if memo_key in self.memo:
+                return self.memo[memo_key][1]
+
+        self.__enter(1)
+        try:
+            valid_obj = scheme.validate(obj)
+        finally:
+            self.depth -= 1
+
+        # Lazy results like the ones of Iterable can be consumed only once, so
+        # only containers and records are memoized.
+        if memo_key is not None and (
+            valid_obj is obj or type(valid_obj) in (list, dict) or isinstance(valid_obj, tuple)
+        ):
+            self.memo[memo_key] = (obj, valid_obj)
+
+        return valid_obj
+
+    def validate_rows(self, rows, scheme):
+        """Validates the specified list of dictionaries against DictScheme."""
+
+        if self.memo is not None:
+            # Rows may be shared, so validate them one by one through the memo
+            for index, row in enumerate(rows):
+                try:
+                    rows[index] = self.validate(row, scheme)
+                except ValidationError as e:
+                    e.prefix_object_name("[{0}]".format(index))
+                    raise
+
+            return
+
+        self.__enter(len(rows))
+        try:
+            return scheme._validate_rows(rows)
+        finally:
+            self.depth -= 1
+
+    def __enter(self, nodes):
+        """Accounts the specified number of nodes on the next nesting level."""
+
+        limits = self.limits
+
+        self.nodes += nodes
+        if limits.max_nodes is not None and self.nodes > limits.max_nodes:
+            raise LimitExceededError("max_nodes")
+
+        if self.deadline is not None and _monotonic() > self.deadline:
+            raise LimitExceededError("timeout")
+
+        if limits.max_depth is not None and self.depth >= limits.max_depth:
+            raise LimitExceededError("max_depth")
+
+        self.depth += 1
+
+    def check(self, obj):
+        """Checks the specified object's size before validating its contents."""
+
+        limits = self.limits
+
+        if type(obj) is str:
+            self.string_length += len(obj)
+            if (
+                limits.max_total_string_length is not None and
+                self.string_length > limits.max_total_string_length
+            ):
+                raise LimitExceededError("max_total_string_length")
+            return
+
+        # Reject large containers before walking through their elements
+        if limits.max_nodes is not None and self.nodes + len(obj) > limits.max_nodes:
+            raise LimitExceededError("max_nodes")
+
+        if type(obj) is dict and limits.max_keys is not None and len(obj) > limits.max_keys:
+            raise LimitExceededError("max_keys")
+
+
+def _check_limits(obj):
+    """Checks the specified object against limits of the current validate() call.
+
+    Note: this function is for internal usage only (from validators).
+    """
+
+    context = _local.context if _context_count else None
+    if context is not None:
+        context.check(obj)
 
 
 def _get_optional(scheme):
@@ -428,6 +1684,78 @@ def _get_optional(scheme):
     return scheme if scheme.optional else None
 
 
+_MODULES = {}
+"""Lazily imported modules."""
+
+
+def _import(name):
+    """Imports the module on first usage to speed up startup."""
+
+    module = _MODULES.get(name)
+    if module is None:
+        module = _MODULES[name] = __import__(name)
+
+    return module
+
+
+def _parse_datetime(string):
+    """Parses a datetime in ISO 8601 format (fallback for Python < 3.7)."""
+
+    for date_format in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(string, date_format)
+        except ValueError:
+            pass
+
+    raise ValueError("Invalid datetime: {0}.".format(_repr(string)))
+
+
+if hasattr(datetime.datetime, "fromisoformat"):
+    _parse_datetime = datetime.datetime.fromisoformat  # noqa: F811
+
+
+def _random_range(low, high, width=1000):
+    """Returns a range for random numbers with optional low and high bounds."""
+
+    if low is None and high is None:
+        return -width, width
+
+    if low is None:
+        return high - width, high
+
+    if high is None:
+        return low, low + width
+
+    return low, high
+
+
+_ALPHABET = string.ascii_letters + string.digits
+"""Characters of random strings."""
+
+
+def _random_string(rng, length):
+    """Generates a random string of the specified length."""
+
+    if hasattr(rng, "choices"):
+        return "".join(rng.choices(_ALPHABET, k=length))
+
+    # Python < 3.6
+    return "".join([rng.choice(_ALPHABET) for _ in range(length)])
+
+
+def _generate_list(rng, scheme, min_length, max_length):
+    """Generates a random list with the specified element scheme."""
+
+    min_length = min_length or 0
+    max_length = min_length + 5 if max_length is None else max_length
+    length = rng.randint(min_length, max_length)
+
+    if scheme is None:
+        return [rng.randint(-1000, 1000) for _ in range(length)]
+
+    return [scheme._generate(rng) for _ in range(length)]
+
+
 def _dict_key_name(key):
     """Formats a key to object name suffix."""
 
@@ -436,3 +1764,252 @@ def _dict_key_name(key):
 
 _repr = (lambda obj: repr(obj)[1:] if type(obj) is str else repr(obj)) if _PY2 else repr
 """More friendly version of repr()."""
+
+
+def main(args=None):
+    """Command line interface.
+
+    Validates NDJSON (or JSON) files against a scheme. NDJSON files are split
+    into chunks on line boundaries which are validated in parallel by a pool
+    of worker processes.
+    """
+
+    import argparse
+    import multiprocessing
+
+    parser = argparse.ArgumentParser(
+        prog="python -m object_validator",
+        description="Validates NDJSON or JSON files against a scheme.")
+    parser.add_argument("scheme", help="scheme to validate against in module:name format")
+    parser.add_argument("files", nargs="+", metavar="file", help="file to validate")
+    parser.add_argument("--json", action="store_true",
+                        help="each file is a single JSON document instead of NDJSON")
+    parser.add_argument("-j", "--jobs", type=int, default=_cpu_count(),
+                        help="number of worker processes (default: %(default)s)")
+    parser.add_argument("--max-errors", type=int, default=10,
+                        help="maximum number of errors to print per file (default: %(default)s)")
+    args = parser.parse_args(args)
+
+    if args.jobs < 1:
+        parser.error("Invalid number of jobs: {0}.".format(args.jobs))
+
+    try:
+        _load_scheme(args.scheme)
+    except (ImportError, AttributeError, ValueError) as e:
+        parser.error("Unable to load {0} scheme: {1}".format(args.scheme, e))
+
+    tasks = []
+    for path in args.files:
+        try:
+            tasks.extend(_split_file(path, args.scheme, args.json, args.jobs, args.max_errors))
+        except EnvironmentError as e:
+            parser.error("Unable to read {0}: {1}".format(path, e.strerror))
+
+    start_time = _monotonic()
+
+    if args.jobs > 1 and len(tasks) > 1:
+        pool = multiprocessing.Pool(args.jobs)
+        try:
+            results = pool.imap(_validate_file_chunk, tasks)
+            reports = _collect_reports(args.files, tasks, results)
+        finally:
+            pool.terminate()
+    else:
+        reports = _collect_reports(args.files, tasks, map(_validate_file_chunk, tasks))
+
+    total_time = _monotonic() - start_time
+    total_objects = total_size = total_errors = 0
+
+    for path in args.files:
+        objects, size, errors, error_count = reports[path]
+        total_objects += objects
+        total_size += size
+        total_errors += error_count
+
+        for line, message in errors[:args.max_errors]:
+            print("{0}:{1}: {2}".format(path, line, message) if line else
+                  "{0}: {1}".format(path, message))
+
+        if error_count > args.max_errors:
+            print("{0}: {1} more errors.".format(path, error_count - args.max_errors))
+
+    sys.stderr.write(
+        "Validated {0} objects ({1:.1f} MB) in {2:.2f}s: {3:.0f} objects/s, {4:.1f} MB/s. "
+        "Errors: {5}.\n".format(
+            total_objects, total_size / 1e6, total_time, total_objects / max(total_time, 1e-9),
+            total_size / 1e6 / max(total_time, 1e-9), total_errors))
+
+    return 1 if total_errors else 0
+
+
+_schemes = {}
+"""Schemes loaded by _load_scheme()."""
+
+
+def _load_scheme(path):
+    """Loads a scheme by its module:name path."""
+
+    import importlib
+
+    try:
+        return _schemes[path]
+    except KeyError:
+        pass
+
+    module_name, _, name = path.partition(":")
+    if not module_name or not name:
+        raise ValueError("Invalid scheme path.")
+
+    scheme = _schemes[path] = getattr(importlib.import_module(module_name), name)
+    return scheme
+
+
+_MIN_CHUNK_SIZE = 1024 * 1024
+"""Minimum size of NDJSON file chunks validated by worker processes."""
+
+
+def _split_file(path, scheme_path, is_json, jobs, max_errors):
+    """Splits the specified file to validation tasks."""
+
+    import mmap
+
+    with open(path, "rb") as data_file:
+        size = _file_size(data_file)
+        if is_json or not size:
+            return [(scheme_path, path, 0, size, is_json, max_errors)]
+
+        data = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            chunk_size = max(size // (jobs * 4), _MIN_CHUNK_SIZE)
+            tasks = []
+
+            start = 0
+            while start < size:
+                end = data.find(b"\n", min(start + chunk_size, size) - 1)
+                end = size if end == -1 else end + 1
+
+                tasks.append((scheme_path, path, start, end, is_json, max_errors))
+                start = end
+
+            return tasks
+        finally:
+            data.close()
+
+
+def _file_size(data_file):
+    """Returns size of the specified file."""
+
+    data_file.seek(0, 2)
+    return data_file.tell()
+
+
+def _validate_file_chunk(task):
+    """Validates a chunk of NDJSON or JSON file.
+
+    Returns (lines, objects, size, errors, error count) where errors are
+    (line number relative to the chunk start or None, message) tuples.
+    """
+
+    scheme_path, path, start, end, is_json, max_errors = task
+    scheme = _load_scheme(scheme_path)
+
+    lines = objects = error_count = 0
+    errors = []
+
+    if start == end:
+        if is_json:
+            # An empty document is invalid JSON, but an empty file can't be mapped
+            errors.append((None, _validate_json(b"", scheme)))
+            objects = error_count = 1
+
+        return lines, objects, 0, errors, error_count
+
+    import mmap
+
+    with open(path, "rb") as data_file:
+        data = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if is_json:
+                objects = 1
+                error = _validate_json(data[start:end], scheme)
+                if error is not None:
+                    errors.append((None, error))
+                    error_count += 1
+            else:
+                data.seek(start)
+
+                while data.tell() < end:
+                    line = data.readline()
+                    lines += 1
+
+                    if not line.strip():
+                        continue
+
+                    objects += 1
+                    error = _validate_json(line, scheme)
+
+                    if error is not None:
+                        error_count += 1
+                        if len(errors) < max_errors:
+                            errors.append((lines, error))
+        finally:
+            data.close()
+
+    return lines, objects, end - start, errors, error_count
+
+
+def _validate_json(data, scheme):
+    """Validates the specified JSON document and returns an error if it's invalid."""
+
+    import json
+
+    # Too deeply nested objects exceed the recursion limit both on decoding and
+    # validation (RuntimeError is a base class of RecursionError which is
+    # raised since Python 3.5).
+    try:
+        obj = json.loads(data.decode("utf-8"))
+    except ValueError as e:
+        return "Invalid JSON: {0}".format(e)
+    except RuntimeError:
+        return "Invalid JSON: the document is too deeply nested."
+
+    try:
+        validate("object", obj, scheme)
+    except ValidationError as e:
+        return str(e)
+    except RuntimeError:
+        return "object is too deeply nested to validate."
+
+
+def _collect_reports(paths, tasks, results):
+    """Merges results of validation tasks into per-file reports.
+
+    Returns {path: (objects, size, errors, error count)} where errors have
+    absolute line numbers.
+    """
+
+    reports = dict((path, (0, 0, [], 0)) for path in paths)
+    line_offsets = dict((path, 0) for path in paths)
+
+    for task, result in zip(tasks, results):
+        path = task[1]
+        lines, objects, size, errors, error_count = result
+        total_objects, total_size, total_errors, total_error_count = reports[path]
+
+        line_offset = line_offsets[path]
+        total_errors.extend(
+            (line if line is None else line_offset + line, message) for line, message in errors)
+        line_offsets[path] += lines
+
+        reports[path] = (
+            total_objects + objects, total_size + size,
+            total_errors, total_error_count + error_count)
+
+    return reports
+
+
+if __name__ == "__main__":
+    # Run main() of the importable module instead of __main__ one, so worker
+    # processes and the loaded schemes share the same classes.
+    from object_validator import main as _main
+    sys.exit(_main())
@@ -2,12 +2,15 @@
 
 from __future__ import unicode_literals
 
+import pickle
+import re
 import sys
 
 import pytest
 
+import object_validator
 from object_validator import Bool, Integer, Float, String
-from object_validator import InvalidTypeError, InvalidValueError
+from object_validator import Error, ValidationError, InvalidTypeError, InvalidValueError
 
 PY2 = sys.version_info < (3,)
 if PY2:
@@ -133,6 +136,101 @@ def test_string_regex_invalid():
         _validate("12345", String(regex=r"^\d{4}$"))
 
 
+@pytest.mark.parametrize(("regex", "mode", "value", "valid"), [
+    (r"\d{2}", "search", "a12b", True),
+    (r"\d{2}", "match", "a12b", False),
+    (r"\d{2}", "match", "12b", True),
+    (r"\d{2}", "fullmatch", "12b", False),
+    (r"\d{2}", "fullmatch", "12", True),
+    (r"^id-\d+$", "search", "id-1\n", True),
+    (r"^id-\d+$", "search", "di-1", False),
+    (r"(?m)^id-\d+$", "search", "a\nid-1", True),
+    (r"id-\d+-end", "fullmatch", "id-1-end", True),
+    (r"id-\d+-end", "fullmatch", "id-1-end!", False),
+    (r"id-\d+-end$", "fullmatch", "id-1-end\n", False),
+    (r"id-\d+|other", "fullmatch", "other", True),
+    (r"(?i)id-\d+", "fullmatch", "ID-1", True),
+    (r"(ab)\1", "fullmatch", "abab", True),
+    (r"(ab)\1", "fullmatch", "ab", False),
+    (r"a{2,3}", "fullmatch", "aaaa", False),
+])
+def test_string_regex_modes(regex, mode, value, valid):
+    scheme = String(regex=regex, regex_mode=mode)
+
+    if valid:
+        _validate(value, scheme)
+    else:
+        with pytest.raises(InvalidValueError):
+            _validate(value, scheme)
+
+
+def test_string_regex_custom_engine():
+    class Regex(object):
+        def __init__(self, pattern):
+            self.regex = re.compile(pattern)
+
+        def fullmatch(self, string):
+            return self.regex.match(string) if string == "12345" else None
+
+    _validate("12345", String(regex=Regex(r"\d+"), regex_mode="fullmatch"))
+
+    with pytest.raises(InvalidValueError):
+        _validate("1234", String(regex=Regex(r"\d+"), regex_mode="fullmatch"))
+
+
+def test_string_regex_invalid_mode():
+    with pytest.raises(Error):
+        String(regex=r"\d+", regex_mode="findall")
+
+
+@pytest.mark.parametrize("regex", ["(", r"(?<=a+)b"])
+def test_string_regex_invalid_pattern(regex):
+    with pytest.raises(Error):
+        String(regex=regex)
+
+
+def test_string_regex_lazy_analysis(monkeypatch):
+    analyzed = []
+    analyze_regex = object_validator._analyze_regex
+
+    def analyze(regex, mode):
+        analyzed.append(regex.pattern)
+        return analyze_regex(regex, mode)
+
+    monkeypatch.setattr(object_validator, "_analyze_regex", analyze)
+
+    scheme = String(regex=r"^\d+$")
+    assert analyzed == []
+
+    _validate("12345", scheme)
+    _validate("54321", scheme)
+    assert analyzed == [r"^\d+$"]
+
+
+def test_string_regex_pickle():
+    scheme = String(regex=r"^id-\d+$")
+    _validate("id-1", scheme)
+
+    scheme = pickle.loads(pickle.dumps(scheme))
+    _validate("id-2", scheme)
+
+    with pytest.raises(InvalidValueError):
+        _validate("di-3", scheme)
+
+
+def test_string_regex_analysis_failure(monkeypatch):
+    def analyze_regex(regex, mode):
+        raise AttributeError()
+
+    monkeypatch.setattr(object_validator, "_analyze_regex", analyze_regex)
+    scheme = String(regex=r"^id-\d+$")
+
+    _validate("id-1", scheme)
+
+    with pytest.raises(InvalidValueError):
+        _validate("di-1", scheme)
+
+
 def test_choices():
     _validate("b", String(choices=("a", "b")))
 
@@ -148,10 +246,15 @@ def test_choices_invalid_value():
 
 def _validate(obj, scheme):
     obj_copy = obj
+    valid = scheme.check(obj)
 
     try:
         validated = scheme.validate(obj)
+    except ValidationError:
+        assert not valid
+        raise
     finally:
         assert obj == obj_copy
 
+    assert valid
     assert validated is obj
@@ -0,0 +1,135 @@
+"""Test command line interface."""
+
+from __future__ import unicode_literals
+
+import io
+import json
+
+import pytest
+
+import object_validator
+from object_validator import Integer, String, DictScheme, main
+
+SCHEME = DictScheme({"id": Integer(), "name": String()})
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_ndjson(tmpdir, capsys, jobs):
+    path = _write(tmpdir, "data.ndjson", "".join(
+        json.dumps({"id": index, "name": "name"}) + "\n" for index in range(100)))
+
+    assert main(["test_cli:SCHEME", path, "--jobs", str(jobs)]) == 0
+
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert "Validated 100 objects" in err
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_ndjson_invalid(tmpdir, capsys, jobs):
+    valid_path = _write(tmpdir, "valid.ndjson", '{"id": 1, "name": "name"}\n')
+    invalid_path = _write(tmpdir, "invalid.ndjson",
+        '{"id": 1, "name": "name"}\n'
+        "\n"
+        '{"id": "2", "name": "name"}\n'
+        "{invalid}\n"
+        '{"id": 3}')
+
+    assert main(["test_cli:SCHEME", valid_path, invalid_path, "--jobs", str(jobs)]) == 1
+
+    out, err = capsys.readouterr()
+    errors = out.splitlines()
+    assert len(errors) == 3
+    assert errors[0] == "{0}:3: object['id'] has an invalid type: str.".format(invalid_path)
+    assert errors[1].startswith("{0}:4: Invalid JSON: ".format(invalid_path))
+    assert errors[2] == "{0}:5: object['name'] is missing.".format(invalid_path)
+    assert "Validated 5 objects" in err
+    assert "Errors: 3." in err
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_ndjson_chunks(tmpdir, capsys, monkeypatch, jobs):
+    monkeypatch.setattr(object_validator, "_MIN_CHUNK_SIZE", 1000)
+
+    lines = [json.dumps({"id": index, "name": "name"}) for index in range(1000)]
+    lines[499] = '{"id": 499}'
+    lines[900] = "{invalid}"
+    path = _write(tmpdir, "data.ndjson", "".join(line + "\n" for line in lines))
+
+    assert len(object_validator._split_file(path, "test_cli:SCHEME", False, jobs, 10)) > 2
+    assert main(["test_cli:SCHEME", path, "--jobs", str(jobs)]) == 1
+
+    out, err = capsys.readouterr()
+    errors = out.splitlines()
+    assert len(errors) == 2
+    assert errors[0] == "{0}:500: object['name'] is missing.".format(path)
+    assert errors[1].startswith("{0}:901: Invalid JSON: ".format(path))
+    assert "Validated 1000 objects" in err
+
+
+def test_ndjson_too_deeply_nested(tmpdir, capsys):
+    path = _write(tmpdir, "data.ndjson",
+                  "[" * 200000 + "\n" + '{"id": 1, "name": "name"}\n')
+
+    assert main(["test_cli:SCHEME", path]) == 1
+
+    out, err = capsys.readouterr()
+    assert out.startswith("{0}:1: Invalid JSON: ".format(path))
+    assert "Validated 2 objects" in err
+    assert "Errors: 1." in err
+
+
+def test_max_errors(tmpdir, capsys):
+    path = _write(tmpdir, "data.ndjson", "{}\n" * 5)
+
+    assert main(["test_cli:SCHEME", path, "--max-errors", "2"]) == 1
+
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [
+        "{0}:1: object['id'] is missing.".format(path),
+        "{0}:2: object['id'] is missing.".format(path),
+        "{0}: 3 more errors.".format(path),
+    ]
+
+
+def test_json(tmpdir, capsys):
+    path = _write(tmpdir, "data.json", '{\n  "id": 1,\n  "name": 2\n}\n')
+
+    assert main(["test_cli:SCHEME", path, "--json"]) == 1
+
+    out, err = capsys.readouterr()
+    assert out == "{0}: object['name'] has an invalid type: int.\n".format(path)
+
+
+def test_json_empty(tmpdir, capsys):
+    path = _write(tmpdir, "data.json", "")
+
+    assert main(["test_cli:SCHEME", path, "--json"]) == 1
+
+    out, err = capsys.readouterr()
+    assert out.startswith("{0}: Invalid JSON: ".format(path))
+    assert "Errors: 1." in err
+
+
+@pytest.mark.parametrize("jobs", ["0", "-1"])
+def test_invalid_jobs(tmpdir, jobs):
+    path = _write(tmpdir, "data.ndjson", "")
+
+    with pytest.raises(SystemExit):
+        main(["test_cli:SCHEME", path, "--jobs", jobs])
+
+
+def test_invalid_scheme(tmpdir):
+    path = _write(tmpdir, "data.ndjson", "")
+
+    with pytest.raises(SystemExit):
+        main(["test_cli:UNKNOWN", path])
+
+
+def _write(tmpdir, name, data):
+    path = str(tmpdir.join(name))
+
+    with io.open(path, "w") as data_file:
+        data_file.write(data)
+
+    return path
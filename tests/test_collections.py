@@ -3,15 +3,18 @@
 from __future__ import unicode_literals
 
 import copy
+import pickle
 import sys
 
 import pytest
 
+import object_validator
 from object_validator import (
     Object, Bool, Integer, Float,
-    String, List, Dict, DictScheme)
+    String, UUID, List, Iterable, Dict, DictScheme)
 from object_validator import (
-    InvalidTypeError, InvalidListLength, MissingParameterError,
+    Error, ValidationError, InvalidTypeError, InvalidListLength, InvalidIterableLength,
+    MissingParameterError,
     UnknownParameterError, ParameterAlreadyExistsError)
 
 PY2 = sys.version_info < (3,)
@@ -72,6 +75,147 @@ def test_list_max_length_invalid():
         _validate([1, 2, 3], List(min_length=1, max_length=2))
 
 
+def test_list_of_dict_schemes():
+    _validate([
+        {"id": 1, "name": "one"},
+        {"id": 2},
+        {"id": 3, "name": "three"},
+        {"name": "four", "id": 4},
+    ], List(DictScheme({"id": Integer(), "name": String(optional=True)})))
+
+
+def test_list_of_dict_schemes_modification():
+    _validate_modification(
+        [{"id": "1", "unknown": 1}, {"id": "2"}, {"id": "3", "unknown": 3}],
+        List(DictScheme({"id": ToInt()}, delete_unknown=True)),
+        [{"id": 1}, {"id": 2}, {"id": 3}])
+
+
+def test_list_of_dict_schemes_invalid_value():
+    error = pytest.raises(InvalidTypeError, lambda:
+        _validate([
+            {"id": 1, "name": "one"},
+            {"id": 2, "name": 2},
+            {"id": 3},
+        ], List(DictScheme({"id": Integer(), "name": String(optional=True)})))
+    ).value
+
+    assert error.object_name == "[1]['name']"
+    assert error.object_type == int
+
+
+def test_list_of_dict_schemes_error_order():
+    error = pytest.raises(InvalidTypeError, lambda:
+        _validate([
+            {"a": 1, "b": "x"},
+            {"a": "y", "b": 2},
+        ], List(DictScheme({"a": Integer(), "b": Integer()})))
+    ).value
+
+    assert error.object_name == "[0]['b']"
+
+
+def test_list_of_dict_schemes_error_modification():
+    obj = [{"a": "1", "b": "x", "c": 1}, {"a": "2", "b": 1, "c": 2}]
+    scheme = List(DictScheme({"a": ToInt(), "b": Integer()}, delete_unknown=True))
+
+    error = pytest.raises(InvalidTypeError, lambda: scheme.validate(obj)).value
+
+    assert error.object_name == "[0]['b']"
+    assert obj == [{"a": 1, "b": "x"}, {"a": "2", "b": 1, "c": 2}]
+
+
+def test_list_of_dict_schemes_error_order_with_missing_parameter():
+    scheme = List(DictScheme({"a": Integer(), "b": Integer()}))
+
+    error = pytest.raises(InvalidTypeError, lambda:
+        _validate([{"a": 1, "b": 1}, {"a": "x", "b": 1}, {"a": 1}], scheme)
+    ).value
+
+    assert error.object_name == "[1]['a']"
+
+    error = pytest.raises(InvalidTypeError, lambda:
+        _validate([{"a": 1, "b": 1}, {"a": "x"}], scheme)
+    ).value
+
+    assert error.object_name == "[1]['a']"
+
+
+def test_list_of_dict_schemes_invalid_element_type():
+    error = pytest.raises(InvalidTypeError, lambda:
+        _validate([{"id": 1}, [], {"id": 3}], List(DictScheme({"id": Integer()})))
+    ).value
+
+    assert error.object_name == "[1]"
+    assert error.object_type == list
+
+
+def test_list_of_dict_schemes_missing_parameter():
+    error = pytest.raises(MissingParameterError, lambda:
+        _validate([{"id": 1}, {"id": 2}, {}], List(DictScheme({"id": Integer()})))
+    ).value
+
+    assert error.object_name == "[2]['id']"
+
+
+def test_iterable():
+    validated = Iterable(ToInt()).validate(str(value) for value in range(3))
+    assert iter(validated) is validated
+    assert list(validated) == [0, 1, 2]
+
+
+def test_iterable_without_scheme():
+    assert list(Iterable().validate(("a", 1))) == ["a", 1]
+
+
+@pytest.mark.parametrize("value", ["string", {}, 1])
+def test_iterable_invalid_type(value):
+    assert not Iterable().check(value)
+
+    error = pytest.raises(InvalidTypeError, lambda:
+        Iterable().validate(value)
+    ).value
+
+    assert error.object_name == ""
+    assert error.object_type == type(value)
+
+
+def test_iterable_invalid_element_type():
+    consumed = []
+    validated = Iterable(Bool()).validate(iter([True, False, 10, True]))
+
+    error = pytest.raises(InvalidTypeError, lambda:
+        consumed.extend(validated)
+    ).value
+
+    assert consumed == [True, False]
+    assert error.object_name == "[2]"
+    assert error.object_type == int
+
+
+def test_iterable_min_max_length_valid():
+    assert list(Iterable(min_length=1, max_length=3).validate(iter([1, 2, 3]))) == [1, 2, 3]
+
+
+def test_iterable_min_length_invalid():
+    with pytest.raises(InvalidIterableLength) as error:
+        list(Iterable(min_length=4).validate(iter([1, 2, 3])))
+
+    assert error.value.length == 3
+
+
+def test_iterable_max_length_invalid():
+    def generate():
+        for value in range(3):
+            yield value
+        raise AssertionError("The iterable must not be consumed further")
+
+    with pytest.raises(InvalidListLength) as error:
+        list(Iterable(max_length=2).validate(generate()))
+
+    assert error.value.length == 3
+
+
 def test_dict_default():
     _validate({
         True: 1,
@@ -112,6 +256,29 @@ def test_dict_invalid_key_modification():
     assert error.object_name == "[1]"
 
 
+def test_dict_check_nested_modification():
+    obj = {"1": {"x": "5"}}
+    scheme = Dict(ToInt(), DictScheme({"x": ToInt()}))
+
+    assert scheme.check(obj)
+    assert obj == {"1": {"x": "5"}}
+
+
+def test_dict_check_converter_keys(monkeypatch):
+    def validate_object(obj, scheme):
+        raise AssertionError("Converter keys must be checked without exceptions.")
+
+    monkeypatch.setattr(object_validator, "validate_object", validate_object)
+
+    key = "12345678-1234-5678-1234-56781234abcd"
+    scheme = Dict(UUID(), Integer())
+
+    assert scheme.check({key: 1})
+    assert not scheme.check({key: 1, "invalid": 2})
+    assert not scheme.check({key: 1, 2: 2})
+    assert not scheme.check({key: 1, key.upper(): 2})
+
+
 def test_dict_invalid_key_scheme():
     error = pytest.raises(InvalidTypeError, lambda:
         _validate({
@@ -136,6 +303,28 @@ def test_dict_invalid_value_scheme():
     assert error.object_type == int
 
 
+def test_dict_key_modification_order():
+    obj = {"1": 10, 2: 20, "3": 30}
+    _validate_modification(obj, Dict(ToInt(), Integer()), {1: 10, 2: 20, 3: 30})
+    assert list(obj) == [2, 1, 3]
+
+
+def test_dict_allocations():
+    tracemalloc = pytest.importorskip("tracemalloc")
+
+    obj = {str(key): key for key in range(10000)}
+    scheme = Dict(String(), Integer())
+
+    tracemalloc.start()
+    try:
+        scheme.validate(obj)
+        allocated = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert allocated < 1024
+
+
 def test_dict_scheme_empty():
     _validate({}, DictScheme({}))
 
@@ -206,18 +395,72 @@ def test_dict_scheme_missing_parameter():
     assert error.object_name == "[1]"
 
 
+def test_dict_scheme_record():
+    scheme = DictScheme({
+        "id": ToInt(),
+        "name": String(),
+        "value": Float(optional=True),
+    }, ignore_unknown=True, record=True)
+
+    record = scheme.validate({"id": "1", "name": "one", "unknown": True})
+    assert type(record) is scheme.record_type
+    assert record == (1, "one", None)
+    assert (record.id, record.name, record.value) == (1, "one", None)
+
+
+def test_dict_scheme_records_list():
+    scheme = List(DictScheme({"id": Integer(), "name": String(optional=True)}, record=True))
+
+    records = scheme.validate([{"id": 1, "name": "one"}, {"id": 2}])
+    assert [(record.id, record.name) for record in records] == [(1, "one"), (2, None)]
+
+
+def test_dict_scheme_record_pickle():
+    scheme = DictScheme({"id": Integer(), "name": String(optional=True)}, record=True)
+    record = scheme.validate({"id": 1})
+
+    unpickled_scheme = pickle.loads(pickle.dumps(scheme))
+    unpickled_record = pickle.loads(pickle.dumps(record))
+
+    assert unpickled_scheme.record_type is scheme.record_type
+    assert type(unpickled_record) is scheme.record_type
+    assert unpickled_record == record
+    assert unpickled_scheme.validate({"id": 2, "name": "two"}) == (2, "two")
+
+
+def test_dict_scheme_record_invalid_keys():
+    with pytest.raises(Error):
+        DictScheme({"valid": Integer(), "in-valid": Integer()}, record=True)
+
+
 def _validate(obj, scheme):
     obj_copy = copy.deepcopy(obj)
+    valid = scheme.check(obj)
+    assert obj == obj_copy
 
     try:
         validated = scheme.validate(obj)
+    except ValidationError:
+        assert not valid
+        raise
     finally:
         assert obj == obj_copy
 
+    assert valid
     assert validated is obj
 
 
 def _validate_modification(obj, scheme, new_obj):
-    validated = scheme.validate(obj)
+    obj_copy = copy.deepcopy(obj)
+    valid = scheme.check(obj)
+    assert obj == obj_copy
+
+    try:
+        validated = scheme.validate(obj)
+    except ValidationError:
+        assert not valid
+        raise
+
+    assert valid
     assert validated is obj
     assert validated == new_obj
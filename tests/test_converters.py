@@ -0,0 +1,125 @@
+"""Test converters validation."""
+
+from __future__ import unicode_literals
+
+import datetime
+import decimal
+import sys
+import uuid
+
+import pytest
+
+from object_validator import DateTime, Decimal, UUID, IPAddress
+from object_validator import ValidationError, InvalidTypeError, InvalidValueError
+
+PY2 = sys.version_info < (3,)
+if PY2:
+    str = unicode
+
+
+def test_datetime():
+    assert _validate("2017-01-02T03:04:05", DateTime()) == \
+        datetime.datetime(2017, 1, 2, 3, 4, 5)
+
+
+def test_datetime_invalid_type():
+    error = pytest.raises(InvalidTypeError, lambda:
+        _validate(datetime.datetime(2017, 1, 2), DateTime())
+    ).value
+
+    assert error.object_name == ""
+    assert error.object_type == datetime.datetime
+
+
+def test_datetime_invalid_value():
+    error = pytest.raises(InvalidValueError, lambda:
+        _validate("2017-13-02T03:04:05", DateTime())
+    ).value
+
+    assert error.object_name == ""
+    assert error.object_value == "2017-13-02T03:04:05"
+
+
+def test_datetime_min_max_valid():
+    _validate("2017-01-02T03:04:05", DateTime(
+        min=datetime.datetime(2017, 1, 2, 3, 4, 5),
+        max=datetime.datetime(2017, 1, 2, 3, 4, 5)))
+
+
+def test_datetime_min_invalid():
+    with pytest.raises(InvalidValueError):
+        _validate("2017-01-02T03:04:05", DateTime(min=datetime.datetime(2018, 1, 1)))
+
+
+def test_datetime_max_invalid():
+    with pytest.raises(InvalidValueError):
+        _validate("2017-01-02T03:04:05", DateTime(max=datetime.datetime(2016, 1, 1)))
+
+
+def test_decimal():
+    assert _validate("1.10", Decimal()) == decimal.Decimal("1.10")
+
+
+@pytest.mark.parametrize("value", [
+    "", "one", "NaN", "Infinity", " 1.5 ", "\n2", "1_000", "\u0661"])
+def test_decimal_invalid_value(value):
+    with pytest.raises(InvalidValueError):
+        _validate(value, Decimal())
+
+
+def test_decimal_min_max_valid():
+    _validate("1.5", Decimal(min=1, max=decimal.Decimal("1.5")))
+
+
+def test_decimal_min_max_invalid():
+    with pytest.raises(InvalidValueError):
+        _validate("1.5", Decimal(min=2))
+
+    with pytest.raises(InvalidValueError):
+        _validate("1.5", Decimal(max=1))
+
+
+def test_uuid():
+    value = "12345678-1234-5678-1234-567812345678"
+    assert _validate(value, UUID()) == uuid.UUID(value)
+
+
+@pytest.mark.parametrize("value", [
+    "12345678-1234-5678-1234-56781234567",
+    "urn:uuid:12345678-1234-5678-1234-567812345678",
+    "{12345678-1234-5678-1234-567812345678}",
+    "12345678123456781234567812345678",
+    "+2345678-1234-5678-1234-567812345678",
+    "1234567-81234-5678-1234-567812345678",
+])
+def test_uuid_invalid_value(value):
+    with pytest.raises(InvalidValueError):
+        _validate(value, UUID())
+
+
+def test_ip_address():
+    assert str(_validate("127.0.0.1", IPAddress())) == "127.0.0.1"
+    assert str(_validate("::1", IPAddress(version=6))) == "::1"
+
+
+def test_ip_address_invalid_value():
+    with pytest.raises(InvalidValueError):
+        _validate("127.0.0.256", IPAddress())
+
+
+def test_ip_address_invalid_version():
+    with pytest.raises(InvalidValueError):
+        _validate("127.0.0.1", IPAddress(version=6))
+
+
+def _validate(obj, scheme):
+    valid = scheme.check(obj)
+
+    try:
+        validated = scheme.validate(obj)
+    except ValidationError:
+        assert not valid
+        raise
+
+    assert valid
+    return validated
@@ -0,0 +1,85 @@
+"""Test object generation."""
+
+from __future__ import unicode_literals
+
+import datetime
+import decimal
+
+import pytest
+
+from object_validator import (
+    Object, Bool, Integer, Float, String, DateTime, Decimal, UUID, IPAddress,
+    List, Iterable, Dict, DictScheme, generate, validate_object)
+from object_validator import Error, ValidationError
+
+SCHEME = List(DictScheme({
+    "id": Integer(min=1),
+    "kind": String(choices={"a", "b", "c"}),
+    "name": String(min_length=1, max_length=10),
+    "value": Float(min=-1.5, max=1.5),
+    "enabled": Bool(),
+    "created": DateTime(min=datetime.datetime(2017, 1, 1), max=datetime.datetime(2017, 1, 2)),
+    "price": Decimal(min=decimal.Decimal("0.01"), max=100, optional=True),
+    "uuid": UUID(optional=True),
+    "address": IPAddress(version=4, optional=True),
+    "tags": List(String(), min_length=1, max_length=3),
+    "history": Iterable(Integer(max=0), optional=True),
+    "attributes": Dict(String(), Integer(), optional=True),
+    "nested": DictScheme({"key": Integer(choices=(1, 2))}),
+}), min_length=1)
+
+
+def test_generate():
+    count = 0
+
+    for obj, error in generate(SCHEME, count=100, seed=0):
+        assert error is None
+        _validate(obj, SCHEME)
+        count += 1
+
+    assert count == 100
+
+
+def test_generate_invalid():
+    invalid = 0
+
+    for obj, error in generate(SCHEME, count=500, seed=0, invalid_ratio=0.5):
+        if error is None:
+            _validate(obj, SCHEME)
+        else:
+            invalid += 1
+            assert pytest.raises(ValidationError, lambda:
+                _validate(obj, SCHEME)
+            ).value.object_name == error
+
+    assert 200 < invalid < 300
+
+
+def test_generate_reproducible():
+    assert list(generate(SCHEME, count=10, seed=1, invalid_ratio=0.5)) == \
+        list(generate(SCHEME, count=10, seed=1, invalid_ratio=0.5))
+
+
+def test_generate_stream():
+    objects = generate(Integer(min=0, max=0))
+    assert [next(objects) for _ in range(3)] == [(0, None)] * 3
+
+
+def test_generate_unsupported():
+    class Custom(Object):
+        def validate(self, obj):
+            return obj
+
+    with pytest.raises(Error):
+        next(generate(List(Custom(), min_length=1)))
+
+    with pytest.raises(Error):
+        next(generate(String(regex=r"\d+")))
+
+
+def _validate(obj, scheme):
+    validated = validate_object(obj, scheme)
+
+    for record in validated:
+        if "history" in record:
+            list(record["history"])
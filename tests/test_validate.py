@@ -4,14 +4,15 @@ from __future__ import unicode_literals
 
 import copy
 import sys
+import threading
 
 import pytest
 
 from object_validator import (
-    Bool, Integer, Float, String,
-    List, Dict, DictScheme, validate)
+    Object, Bool, Integer, Float, String, Decimal,
+    List, Dict, DictScheme, Iterable, Limits, validate, validate_threaded, is_valid)
 from object_validator import (
-    InvalidTypeError, InvalidValueError,
+    Error, ValidationError, InvalidTypeError, InvalidValueError, LimitExceededError,
     UnknownParameterError, MissingParameterError)
 
 PY2 = sys.version_info < (3,)
@@ -38,14 +39,16 @@ ITEMS = [{
     },
 }]
 
-SCHEME = List(DictScheme({
+ITEM_SCHEME = DictScheme({
     "id": Integer(choices=(0, 2)),
     "name": String(),
     "value": Float(),
     "zero": Bool(),
     "dividers": List(Integer()),
     "dividers_map": Dict(Integer(), Float()),
-}))
+})
+
+SCHEME = List(ITEM_SCHEME)
 
 
 def test_validate():
@@ -94,12 +97,186 @@ def test_validate_missing_parameter():
     ).value.object_name == "items[1]['id']"
 
 
-def _validate(name, obj, scheme):
+def test_is_valid():
+    items = copy.deepcopy(ITEMS)
+    assert is_valid(items, SCHEME)
+    assert items == ITEMS
+
+
+def test_is_valid_invalid():
+    items = copy.deepcopy(ITEMS)
+    items[1]["dividers_map"][3] = "3.0"
+    assert not is_valid(items, SCHEME)
+
+
+def test_validate_limits():
+    _validate("items", copy.deepcopy(ITEMS), SCHEME, Limits(
+        max_nodes=100, max_depth=4, max_keys=6, max_total_string_length=7, timeout=60))
+
+
+@pytest.mark.parametrize(("limits", "limit", "name"), [
+    (Limits(max_nodes=10), "max_nodes", "items[1]['zero']"),
+    (Limits(max_depth=3), "max_depth", "items[1]['dividers'][0]"),
+    (Limits(max_keys=5), "max_keys", "items[0]"),
+    (Limits(max_total_string_length=6), "max_total_string_length", "items[1]['name']"),
+    (Limits(timeout=-1), "timeout", "items"),
+])
+def test_validate_limits_exceeded(limits, limit, name):
+    error = pytest.raises(LimitExceededError, lambda:
+        _validate("items", copy.deepcopy(ITEMS), SCHEME, limits)
+    ).value
+
+    assert error.limit == limit
+    assert error.object_name == name
+
+    # Limits must not affect the following calls
+    _validate("items", copy.deepcopy(ITEMS), SCHEME)
+
+
+def test_validate_limits_converter_string_length():
+    error = pytest.raises(LimitExceededError, lambda:
+        validate("items", ["1.5", "1" * 100], List(Decimal()), Limits(max_total_string_length=10))
+    ).value
+
+    assert error.limit == "max_total_string_length"
+    assert error.object_name == "items[1]"
+
+
+def test_validate_limits_large_list():
+    items = list(range(1000))
+
+    error = pytest.raises(LimitExceededError, lambda:
+        validate("items", items, List(Integer()), Limits(max_nodes=100))
+    ).value
+
+    assert error.limit == "max_nodes"
+    assert error.object_name == "items"
+
+
+def test_validate_memoize():
+    class Counter(Object):
+        def __init__(self):
+            self.calls = 0
+
+        def validate(self, obj):
+            self.calls += 1
+            return obj + 1
+
+    counter = Counter()
+    defaults = {"value": 0}
+    obj = {"first": defaults, "second": [defaults, defaults]}
+    defaults_scheme = DictScheme({"value": counter})
+    scheme = DictScheme({"first": defaults_scheme, "second": List(defaults_scheme)})
+
+    assert validate("obj", obj, scheme, memoize=True) is obj
+    assert obj == {"first": {"value": 1}, "second": [{"value": 1}, {"value": 1}]}
+    assert obj["first"] is obj["second"][0] is obj["second"][1]
+    assert counter.calls == 1
+
+
+def test_validate_memoize_dag():
+    obj = [0]
+    for depth in range(30):
+        obj = [obj, obj]
+
+    scheme = Integer()
+    for depth in range(31):
+        scheme = List(scheme)
+
+    assert validate("obj", obj, scheme, memoize=True) is obj
+
+
+def test_validate_memoize_iterable():
+    shared = [1, 2]
+    iterable_scheme = Iterable(Integer())
+    scheme = DictScheme({"a": iterable_scheme, "b": iterable_scheme})
+
+    obj = validate("obj", {"a": shared, "b": shared}, scheme, memoize=True)
+    assert list(obj["a"]) == [1, 2]
+    assert list(obj["b"]) == [1, 2]
+
+
+def test_validate_threaded():
+    items = [copy.deepcopy(item) for item in ITEMS * 50]
+    assert validate_threaded(items, ITEM_SCHEME, workers=4) == items
+
+
+def test_validate_threaded_invalid():
+    items = [copy.deepcopy(item) for item in ITEMS * 50]
+    items[77]["id"] = 1
+    items[93]["id"] = "string"
+
+    with pytest.raises(InvalidValueError) as error:
+        validate_threaded(items, ITEM_SCHEME, workers=4)
+
+    assert error.value.object_name == "[77]['id']"
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_validate_threaded_invalid_workers(workers):
+    with pytest.raises(Error):
+        validate_threaded([], ITEM_SCHEME, workers=workers)
+
+
+def test_shared_scheme_stress():
+    scheme = List(DictScheme({
+        "id": Integer(min=0),
+        "name": String(regex=r"^item-\d+$"),
+        "tags": Dict(String(), List(Bool())),
+    }))
+
+    errors = []
+    barrier = threading.Barrier(8) if not PY2 else None
+
+    def worker(thread_id):
+        try:
+            if barrier is not None:
+                barrier.wait()
+
+            for iteration in range(200):
+                items = [{
+                    "id": index,
+                    "name": "item-{0}".format(index),
+                    "tags": {"tag": [True, False]},
+                } for index in range(10)]
+
+                invalid = (thread_id + iteration) % 3 == 0
+                if invalid:
+                    items[thread_id]["name"] = "invalid"
+
+                assert is_valid(items, scheme) is not invalid
+
+                if invalid:
+                    assert pytest.raises(InvalidValueError, lambda:
+                        validate("items", items, scheme)
+                    ).value.object_name == "items[{0}]['name']".format(thread_id)
+                else:
+                    assert validate("items", items, scheme) is items
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(thread_id,)) for thread_id in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def _validate(name, obj, scheme, limits=None):
     obj_copy = copy.deepcopy(obj)
+    valid = is_valid(obj, scheme)
 
     try:
-        validated = validate(name, obj, scheme)
+        validated = validate(name, obj, scheme, limits)
+    except LimitExceededError:
+        raise
+    except ValidationError:
+        assert not valid
+        raise
     finally:
         assert obj == obj_copy
 
+    assert valid
     assert validated is obj